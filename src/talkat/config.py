@@ -24,6 +24,12 @@ CODE_DEFAULTS: dict[str, Any] = {
     "silence_threshold_fallback": 500.0,  # Fallback threshold when auto-detection fails
     "silence_threshold_min": 50.0,  # Minimum allowed silence threshold
     "silence_threshold_max": 5000.0,  # Maximum allowed silence threshold
+    # How AudioSession decides the speaker has stopped: "rms" compares the
+    # calibrated silence_threshold against chunk volume; "webrtc" uses the
+    # WebRTC VAD (optional `webrtcvad` package, falls back to "rms" when
+    # missing). Either way it only decides when to STOP, never what to send.
+    "vad_backend": "rms",
+    "vad_aggressiveness": 2,  # WebRTC VAD mode, 0 (least) - 3 (most aggressive)
     # Pin the capture device by case-insensitive name substring (e.g.
     # "pipewire", "headset"). None = use the system default input device.
     "input_device_name": None,
@@ -23,7 +23,7 @@ from .logging_config import get_logger
 from .paths import TRANSCRIPT_DIR
 from .process_manager import ProcessManager
 from .record import AudioSession, AudioSessionError, calibrate_microphone
-from .security import safe_subprocess_run, sanitize_text_for_typing
+from .security import command_available, safe_subprocess_run, sanitize_text_for_typing
 
 logger = get_logger(__name__)
 
@@ -59,12 +59,26 @@ def save_transcript(text: str, mode: str = "short") -> Path:
 
 def _notify(message: str) -> None:
     """Send a desktop notification; a notification failure must never break dictation."""
+    if not command_available("notify-send"):
+        return
     try:
         safe_subprocess_run(["notify-send", "Talkat", message], check=False)
     except Exception as e:
         logger.debug(f"Notification failed: {e}")
 
 
+def _notify_in_background(message: str) -> threading.Thread:
+    """Send a notification without waiting for notify-send's fork/exec.
+
+    For the recording-started toast, which fires while the microphone is
+    already open: blocking there delays the first chunk reaching the server.
+    The thread is non-daemon so a toast sent just before exit still goes out.
+    """
+    thread = threading.Thread(target=_notify, args=(message,), name="talkat-notify")
+    thread.start()
+    return thread
+
+
 def _log_threshold_source(threshold: float) -> None:
     """Emit a one-line info log about where the threshold came from."""
     if threshold == CODE_DEFAULTS["silence_threshold"]:
@@ -143,6 +157,7 @@ class TranscriptionClient:
             max_duration=max_duration,
             stop_event=stop_event,
             debug=debug,
+            config=self.config,
         ) as session:
             if on_recording_started is not None:
                 on_recording_started()
@@ -292,7 +307,7 @@ def listen_once(
 
     def _announce_recording() -> None:
         logger.info("Recording — speak now. (Run 'talkat listen' again to stop.)")
-        _notify('Recording... Run "talkat listen" again to stop')
+        _notify_in_background('Recording... Run "talkat listen" again to stop')
 
     server_metadata: dict[str, float] = {
         "audio_duration": 0.0,
@@ -17,7 +17,6 @@ Design:
 
 from __future__ import annotations
 
-import contextlib
 import os
 from typing import Any
 
@@ -33,9 +32,9 @@ _DEFAULT_TIMEOUT = 30.0
 def _notify(message: str) -> None:
     """Send a desktop notification; ignore failure (notify-send may be missing)."""
     # Local import to avoid a hard dep cycle (security → subprocess → logging).
-    from .security import safe_subprocess_run
+    from .security import command_available, safe_subprocess_run
 
-    with contextlib.suppress(FileNotFoundError):
+    if command_available("notify-send"):
         safe_subprocess_run(["notify-send", "Talkat", message], check=False)
 
 
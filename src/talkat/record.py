@@ -1,11 +1,15 @@
 import collections
 import contextlib
+import logging
+import math
 import os
+import queue
 import sys
 import threading
 import time
 from collections.abc import Iterator
 from types import TracebackType
+from typing import Any, Protocol
 
 import numpy as np
 import pyaudio
@@ -13,7 +17,7 @@ import pyaudio
 from .config import CODE_DEFAULTS, load_app_config
 from .devices import find_microphone
 from .logging_config import get_logger
-from .security import safe_subprocess_run
+from .security import command_available, safe_subprocess_run
 
 logger = get_logger(__name__)
 
@@ -49,6 +53,119 @@ def _suppress_native_stderr() -> Iterator[None]:
         os.close(saved_fd)
 
 
+def _load_webrtc_vad(aggressiveness: int) -> Any | None:
+    """Return a ``webrtcvad.Vad``, or None when the optional package is missing.
+
+    WebRTC's VAD is a GMM classifier in C: no calibration, and far less
+    fooled by steady background noise than an RMS threshold.
+    """
+    try:
+        import webrtcvad
+    except ImportError:
+        logger.warning(
+            "vad_backend 'webrtc' needs the webrtcvad package (the talkat[webrtc] extra); "
+            "falling back to the RMS silence threshold"
+        )
+        return None
+    return webrtcvad.Vad(aggressiveness)
+
+
+# Frame lengths webrtcvad accepts; anything else raises inside is_speech().
+WEBRTC_FRAME_MS = (10, 20, 30)
+
+
+def _sorted_percentiles(sorted_values: np.ndarray, percents: list[float]) -> np.ndarray:
+    """Percentiles of an already-sorted array, interpolated like np.percentile.
+
+    np.percentile can't know its input is sorted and partitions a copy on
+    every call; here each percentile is two index lookups and a lerp.
+    """
+    positions = (sorted_values.size - 1) * np.asarray(percents, dtype=np.float64) / 100.0
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, sorted_values.size - 1)
+    below = sorted_values[lower]
+    result: np.ndarray = below + (sorted_values[upper] - below) * (positions - lower)
+    return result
+
+
+class SpeechDetector(Protocol):
+    """Per-chunk speech/silence decision behind AudioSession's auto-stop.
+
+    The detector only decides when an utterance is over — every chunk is
+    streamed regardless. Implementations are duck-typed, like the ASR
+    backends in ``backends.py``.
+
+    Attributes:
+        name: Human-readable description, used in the "Recording (...)" log.
+    """
+
+    name: str
+
+    def is_speech(self, data: bytes) -> bool:
+        """Return whether this int16 mono chunk contains speech."""
+        ...
+
+    def debug_level(self, speech: bool) -> str:
+        """Describe the last decision for debug logs (only called with DEBUG on)."""
+        ...
+
+
+class RMSSpeechDetector:
+    """Smoothed RMS energy against the calibrated ``silence_threshold``."""
+
+    SMOOTHING_WINDOW = 3
+
+    def __init__(self, threshold: float, chunk_samples: int) -> None:
+        self.name = f"threshold {threshold:.1f}"
+        self.threshold = threshold
+        # Samples are widened into one reusable int64 buffer (no fresh copy
+        # per chunk) and np.dot squares and sums them in one pass. int64 is
+        # exact here — a full-scale chunk sums to ~1e12 — where float32's
+        # 24-bit mantissa would round.
+        self._scratch = np.empty(chunk_samples, dtype=np.int64)
+        # The window averages per-chunk RMS amplitude, as the original
+        # smoothing did — averaging energy instead would let one loud click
+        # between quiet chunks push the window over the threshold and start
+        # the silence timer before anyone speaks. That costs one sqrt per chunk.
+        self._history: collections.deque[float] = collections.deque(maxlen=self.SMOOTHING_WINDOW)
+
+    def is_speech(self, data: bytes) -> bool:
+        audio_np = np.frombuffer(data, dtype=np.int16)
+        samples = self._scratch[: audio_np.size]
+        np.copyto(samples, audio_np)
+        energy = int(np.dot(samples, samples))
+        history = self._history
+        history.append(math.sqrt(energy / samples.size) if samples.size else 0.0)
+        return sum(history) > self.threshold * len(history)
+
+    def debug_level(self, speech: bool) -> str:
+        history = self._history
+        if not history:
+            return f"Vol: 0.0 (Thr: {self.threshold:.1f})"
+        smoothed = sum(history) / len(history)
+        return f"Vol: {history[-1]:.1f} Smooth: {smoothed:.1f} (Thr: {self.threshold:.1f})"
+
+
+class WebRTCSpeechDetector:
+    """WebRTC's GMM voice-activity detector (the optional ``webrtcvad`` package)."""
+
+    def __init__(self, vad: Any, aggressiveness: int, sample_rate: int, frame_bytes: int) -> None:
+        self.name = f"WebRTC VAD mode {aggressiveness}"
+        self._vad = vad
+        self._sample_rate = sample_rate
+        self._frame_bytes = frame_bytes
+
+    def is_speech(self, data: bytes) -> bool:
+        # webrtcvad only takes exact 10/20/30 ms frames. A short read can't be
+        # classified, so it counts as speech and never toward the silence stop.
+        if len(data) != self._frame_bytes:
+            return True
+        return bool(self._vad.is_speech(data, self._sample_rate))
+
+    def debug_level(self, speech: bool) -> str:
+        return f"WebRTC speech: {speech}"
+
+
 class AudioSessionError(RuntimeError):
     """Raised when the microphone or audio stream can't be opened."""
 
@@ -70,6 +187,11 @@ class AudioSession:
     ``silence_duration`` seconds after speech has been detected, (b)
     ``max_duration`` is reached, or (c) ``stop_event`` is set. Setting
     ``threshold=0`` disables the silence auto-stop entirely.
+
+    With config ``vad_backend: "webrtc"`` the WebRTC VAD makes the
+    speech/silence call instead of the threshold (which then only acts as
+    the ``0`` = off switch). Its 10/20/30 ms frame sizes match
+    ``chunk_size_ms``.
     """
 
     FORMAT = pyaudio.paInt16
@@ -81,6 +203,10 @@ class AudioSession:
     OPEN_ATTEMPTS = 2
     OPEN_RETRY_DELAY_S = 0.2
 
+    # How long the capture loop waits for PortAudio to deliver a chunk before
+    # checking whether the stream died (device unplugged, server gone).
+    READ_TIMEOUT_S = 1.0
+
     def __init__(
         self,
         threshold: float,
@@ -89,8 +215,12 @@ class AudioSession:
         chunk_size_ms: int = 30,
         stop_event: threading.Event | None = None,
         debug: bool = False,
+        config: dict[str, Any] | None = None,
     ):
-        config = load_app_config()
+        # Callers that already hold the effective config (with CLI overrides
+        # merged) pass it in; re-reading it from disk here would drop them.
+        if config is None:
+            config = load_app_config()
         self.threshold = threshold
         self.silence_duration = (
             silence_duration
@@ -103,6 +233,10 @@ class AudioSession:
             else config.get("max_recording_duration", CODE_DEFAULTS["max_recording_duration"])
         )
         self.input_device_name: str | None = config.get("input_device_name") or None
+        self.vad_backend: str = config.get("vad_backend", CODE_DEFAULTS["vad_backend"])
+        self.vad_aggressiveness = int(
+            config.get("vad_aggressiveness", CODE_DEFAULTS["vad_aggressiveness"])
+        )
         self.chunk_size_ms = chunk_size_ms
         self.stop_event = stop_event
         self.debug = debug
@@ -111,6 +245,8 @@ class AudioSession:
         self._chunk_samples = int(self.SAMPLE_RATE * chunk_size_ms / 1000)
         self._p: pyaudio.PyAudio | None = None
         self._stream: pyaudio.Stream | None = None
+        self._chunks: queue.SimpleQueue[bytes] = queue.SimpleQueue()
+        self._overflows = 0
 
     def __enter__(self) -> "AudioSession":
         last_error: Exception | None = None
@@ -134,6 +270,7 @@ class AudioSession:
                         input=True,
                         input_device_index=mic_index,
                         frames_per_buffer=self._chunk_samples,
+                        stream_callback=self._on_audio,
                     )
                     self._p = p
                     return self
@@ -146,6 +283,22 @@ class AudioSession:
             )
         raise AudioSessionError(f"Failed to open audio stream: {last_error}") from last_error
 
+    def _on_audio(
+        self, in_data: bytes | None, frame_count: int, time_info: Any, status: int
+    ) -> tuple[None, int]:
+        """PortAudio stream callback: hand each captured chunk to the consumer.
+
+        Runs on PortAudio's thread, so capture keeps pace with the device even
+        while the consumer is blocked (e.g. the streaming POST is waiting on
+        the server) — in blocking-read mode that stall overflowed PortAudio's
+        buffer and silently dropped audio.
+        """
+        if status & pyaudio.paInputOverflow:
+            self._overflows += 1
+        if in_data:
+            self._chunks.put_nowait(in_data)
+        return None, pyaudio.paContinue
+
     def __exit__(
         self,
         exc_type: type[BaseException] | None,
@@ -163,11 +316,28 @@ class AudioSession:
                 self._p.terminate()
             self._p = None
 
+    def _speech_detector(self) -> SpeechDetector | None:
+        """Build the configured auto-stop detector; None means never auto-stop."""
+        if self.threshold == 0:
+            return None
+        if self.vad_backend == "webrtc":
+            if self.chunk_size_ms not in WEBRTC_FRAME_MS:
+                logger.warning(
+                    f"WebRTC VAD needs 10, 20 or 30 ms chunks (got {self.chunk_size_ms} ms); "
+                    "falling back to the RMS silence threshold"
+                )
+            else:
+                vad = _load_webrtc_vad(self.vad_aggressiveness)
+                if vad is not None:
+                    return WebRTCSpeechDetector(
+                        vad, self.vad_aggressiveness, self.SAMPLE_RATE, self._chunk_samples * 2
+                    )
+        return RMSSpeechDetector(self.threshold, self._chunk_samples)
+
     def __iter__(self) -> Iterator[bytes]:
         if self._stream is None:
             raise RuntimeError("AudioSession must be used as a context manager")
 
-        no_vad_mode = self.threshold == 0
         max_silent_chunks = int(self.silence_duration * self.SAMPLE_RATE / self._chunk_samples)
         max_total_chunks: float = (
             float("inf")
@@ -175,90 +345,94 @@ class AudioSession:
             else int(self.max_duration * self.SAMPLE_RATE / self._chunk_samples)
         )
 
-        smoothing_window: int = 3
-        volume_history: collections.deque[float] = collections.deque(maxlen=smoothing_window)
+        detector = self._speech_detector()
 
         speech_started = False
         silent_chunks = 0
         total_chunks = 0
 
-        if no_vad_mode:
+        if detector is None:
             logger.info(
                 f"Streaming continuously without VAD (max duration: {self.max_duration}s)..."
             )
         else:
             logger.info(
-                f"Recording (threshold {self.threshold:.1f}, stops after "
+                f"Recording ({detector.name}, stops after "
                 f"{self.silence_duration:.1f}s of post-speech silence)..."
             )
 
+        # Bind per-chunk lookups once; the loop runs up to ~100 times a second
+        # for the whole recording.
+        stop_event = self.stop_event
+        # `debug` comes from config, independently of the log level: without
+        # --verbose every debug record would be built only to be dropped.
+        debug = self.debug and logger.isEnabledFor(logging.DEBUG)
+        get_chunk = self._chunks.get
+        read_timeout = self.READ_TIMEOUT_S
+        log_every = max(1, int(1000 / self.chunk_size_ms) // 2)
+
         while total_chunks < max_total_chunks:
-            if self.stop_event is not None and self.stop_event.is_set():
+            if stop_event is not None and stop_event.is_set():
                 logger.info("Stop requested — finishing this recording...")
                 return
 
             try:
-                data = self._stream.read(self._chunk_samples, exception_on_overflow=False)
-                total_chunks += 1
-            except OSError as e:
-                if e.errno == pyaudio.paInputOverflowed:
-                    if self.debug:
-                        logger.debug("Input overflowed. Skipping frame.")
+                data = get_chunk(timeout=read_timeout)
+            except queue.Empty:
+                if self._stream.is_active():
                     continue
-                logger.error(f"Error reading audio: {e}")
+                logger.error("Audio stream stopped delivering audio.")
                 return
+            total_chunks += 1
 
-            # Every chunk is streamed; the volume tracking below only decides
-            # when to stop.
+            # Every chunk is streamed; the detector below only decides when
+            # to stop.
             yield data
 
-            if no_vad_mode:
+            if detector is None:
                 continue
 
-            audio_np = np.frombuffer(data, dtype=np.int16)
-            if audio_np.size == 0:
-                continue
-
-            volume = float(np.sqrt(np.mean(audio_np.astype(np.float32) ** 2)))
-            volume_history.append(volume)
-            smoothed = float(np.mean(volume_history))
+            speech = detector.is_speech(data)
 
-            if self.debug and total_chunks % max(1, int(1000 / self.chunk_size_ms) // 2) == 0:
+            if debug and total_chunks % log_every == 0:
                 silent_time = silent_chunks * self.chunk_size_ms / 1000.0
                 max_silent_time = max_silent_chunks * self.chunk_size_ms / 1000.0
                 logger.debug(
-                    f"Chunk {total_chunks}: Vol: {volume:.1f} Smooth: {smoothed:.1f} "
-                    f"(Thr: {self.threshold:.1f}) "
+                    f"Chunk {total_chunks}: {detector.debug_level(speech)} "
                     f"Silent: {silent_time:.1f}s/{max_silent_time:.1f}s "
                     f"Speech started: {speech_started}"
                 )
 
-            if smoothed > self.threshold:
-                if not speech_started and self.debug:
-                    logger.debug(f"Speech detected. Volume: {volume:.1f}")
+            if speech:
+                if not speech_started and debug:
+                    logger.debug(f"Speech detected. {detector.debug_level(speech)}")
                 speech_started = True
                 silent_chunks = 0
             elif speech_started:
                 silent_chunks += 1
                 if silent_chunks > max_silent_chunks:
-                    if self.debug:
+                    if debug:
                         logger.debug("Silence duration exceeded, stopping stream.")
                     return
 
-        if self.debug:
+        if debug:
             logger.debug(f"Streaming loop finished. Processed {total_chunks} chunks.")
+            if self._overflows:
+                logger.debug(f"PortAudio reported {self._overflows} input overflows.")
 
 
 def calibrate_microphone(duration: int = 10) -> float:
     """Calibrates the microphone to determine an appropriate silence threshold using background noise analysis."""
 
     config = load_app_config()
-    CHUNK = 1024
-    FORMAT = AudioSession.FORMAT
-    CHANNELS = AudioSession.CHANNELS
+    fallback = float(
+        config.get("silence_threshold_fallback", CODE_DEFAULTS["silence_threshold_fallback"])
+    )
     RATE = AudioSession.SAMPLE_RATE
+    CHUNK_MS = 64
+    CHUNK = int(RATE * CHUNK_MS / 1000)  # 1024 samples
 
-    with contextlib.suppress(FileNotFoundError):
+    if command_available("notify-send"):
         safe_subprocess_run(
             [
                 "notify-send",
@@ -276,79 +450,59 @@ def calibrate_microphone(duration: int = 10) -> float:
     logger.info("Measuring ambient noise levels...")
     logger.info("-" * 60)
 
-    with _suppress_native_stderr():
-        p = pyaudio.PyAudio()
-        # Same-instance resolve + open — see find_microphone for the race
-        # this avoids.
-        mic_index: int | None = find_microphone(
-            p, preferred_name=config.get("input_device_name") or None
-        )
-        if mic_index is None:
-            logger.warning("No microphone found during calibration, using default threshold.")
-            p.terminate()
-            return float(
-                config.get(
-                    "silence_threshold_fallback", CODE_DEFAULTS["silence_threshold_fallback"]
-                )
-            )
-
-        try:
-            stream = p.open(
-                format=FORMAT,
-                channels=CHANNELS,
-                rate=RATE,
-                input=True,
-                input_device_index=mic_index,
-                frames_per_buffer=CHUNK,
-            )
-        except Exception as e:
-            logger.error(f"Error opening audio stream for calibration: {e}")
-            p.terminate()
-            return float(
-                config.get(
-                    "silence_threshold_fallback", CODE_DEFAULTS["silence_threshold_fallback"]
-                )
-            )
-
-    volumes: list[float] = []
+    raw_audio = bytearray()
     chunks_to_read: int = int(duration * RATE / CHUNK)
 
+    # AudioSession owns the PyAudio lifecycle for calibration too: same-instance
+    # device resolution, the fresh-instance retry, and teardown. threshold=0
+    # turns off its silence auto-stop, so it yields exactly chunks_to_read
+    # chunks. PyAudio is deliberately not cached across sessions — a reused
+    # instance keeps a stale device snapshot (see find_microphone).
     try:
-        for i in range(chunks_to_read):
-            data = stream.read(CHUNK, exception_on_overflow=False)
-            audio_data = np.frombuffer(data, dtype=np.int16)
-            volume = np.sqrt(np.mean(audio_data.astype(np.float32) ** 2))
-            volumes.append(volume)
-
-            progress = (i + 1) / chunks_to_read
+        with AudioSession(
+            threshold=0, max_duration=duration, chunk_size_ms=CHUNK_MS, config=config
+        ) as session:
             bar_length = 40
-            filled = int(bar_length * progress)
-            bar = "█" * filled + "░" * (bar_length - filled)
-            print(
-                f"\rProgress: [{bar}] {progress * 100:.0f}% | Current: {volume:6.1f}",
-                end="",
-                flush=True,
-            )
-    finally:
-        stream.stop_stream()
-        stream.close()
-        p.terminate()
-        logger.info("")
-
-    if not volumes:
-        return float(
-            config.get("silence_threshold_fallback", CODE_DEFAULTS["silence_threshold_fallback"])
-        )
-
-    volumes_array = np.array(volumes)
-
-    noise_floor: float = float(np.percentile(volumes_array, 90))
-    p50: float = float(np.percentile(volumes_array, 50))
-    p75: float = float(np.percentile(volumes_array, 75))
-    p95: float = float(np.percentile(volumes_array, 95))
-    p99: float = float(np.percentile(volumes_array, 99))
-    max_vol: float = float(np.max(volumes_array))
-    min_vol: float = float(np.min(volumes_array))
+            last_filled = -1
+            try:
+                for i, data in enumerate(session):
+                    raw_audio += data
+
+                    # Redraw only when the bar visibly grows: 40 flushed writes
+                    # instead of one per 64 ms chunk.
+                    progress = (i + 1) / chunks_to_read
+                    filled = int(bar_length * progress)
+                    if filled != last_filled:
+                        last_filled = filled
+                        bar = "█" * filled + "░" * (bar_length - filled)
+                        print(f"\rProgress: [{bar}] {progress * 100:.0f}%", end="", flush=True)
+            finally:
+                logger.info("")
+    except AudioSessionError as e:
+        logger.warning(f"Calibration couldn't open the microphone ({e}); using default threshold.")
+        return fallback
+
+    # Per-chunk RMS for the whole recording in one vectorized pass (a short
+    # trailing read, if any, is dropped so the reshape stays rectangular).
+    # frombuffer views the capture without copying, but the int64 widening is
+    # a full copy at 4x the capture's size — needed so the sums of squares are
+    # exact. einsum then fuses the square and the row sum, so no squared
+    # temporary is materialized on top of it.
+    samples = np.frombuffer(raw_audio, dtype=np.int16)
+    frames = samples[: samples.size - samples.size % CHUNK].reshape(-1, CHUNK).astype(np.int64)
+    volumes_array = np.sqrt(np.einsum("ij,ij->i", frames, frames) / CHUNK)
+
+    if volumes_array.size == 0:
+        return fallback
+
+    # One sort serves every statistic: min/max are the ends, and the five
+    # percentiles are index lookups into the sorted array.
+    volumes_sorted = np.sort(volumes_array)
+    min_vol = float(volumes_sorted[0])
+    max_vol = float(volumes_sorted[-1])
+    p50, p75, noise_floor, p95, p99 = (
+        float(v) for v in _sorted_percentiles(volumes_sorted, [50, 75, 90, 95, 99])
+    )
 
     threshold: float = p95
 
@@ -373,7 +527,7 @@ def calibrate_microphone(duration: int = 10) -> float:
     logger.info("  (95th percentile - ignores top 5% noise spikes)")
     logger.info("=" * 60)
 
-    with contextlib.suppress(FileNotFoundError):
+    if command_available("notify-send"):
         safe_subprocess_run(
             ["notify-send", "Calibration Complete", f"Threshold set to {threshold:.0f}"],
             check=False,
@@ -1,7 +1,9 @@
 """Security and input validation utilities for Talkat."""
 
-import os
+import functools
 import re
+import shutil
+import string
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +11,19 @@ from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Compiled once: the sanitizers run on every transcript, and the validators on
+# every config load and server request.
+_LANGUAGE_RE = re.compile(r"^[a-z]{2,3}$")
+_ENV_VAR_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_NEWLINE_RUN_RE = re.compile(r"[\r\n]+")
+_BLANK_RUN_RE = re.compile(r"[ \t]+")
+# Deleting every allowed character leaves "" exactly when a model name is
+# clean — one str.translate pass instead of a regex match.
+_MODEL_NAME_CHARS = dict.fromkeys(map(ord, string.ascii_letters + string.digits + "._/-"))
+# str.translate deletion table for C0 control characters and DEL, keeping
+# tab, newline and carriage return: one C-level pass, no regex engine.
+_CONTROL_CHAR_TABLE = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F])
+
 
 class SecurityError(Exception):
     """Raised when a security violation is detected."""
@@ -40,6 +55,10 @@ def validate_port(port: int | str) -> int:
     return port_int
 
 
+# Top-level directories whose access gets a warning in validate_file_path.
+_SENSITIVE_TOPLEVEL_DIRS = frozenset({"etc", "boot", "sys", "proc", "dev", "root"})
+
+
 def validate_file_path(
     path: str | Path, must_exist: bool = False, allow_symlinks: bool = False
 ) -> Path:
@@ -58,12 +77,11 @@ def validate_file_path(
         SecurityError: If path is unsafe
         FileNotFoundError: If must_exist=True and path doesn't exist
     """
-    # Reject path-traversal segments before touching the filesystem.
-    try:
-        if "../" in str(path) or "..\\" in str(path):
-            raise SecurityError(f"Path traversal attempt detected: {path}")
-    except (OSError, ValueError) as e:
-        raise SecurityError(f"Invalid path: {path}") from e
+    # Reject path-traversal segments before touching the filesystem. Folding
+    # backslashes to slashes first lets one scan catch both separators.
+    path_str = str(path).replace("\\", "/")
+    if "../" in path_str or path_str == "..":
+        raise SecurityError(f"Path traversal attempt detected: {path}")
 
     # Symlink check MUST run before .resolve() — .resolve() follows symlinks,
     # so any check on the resolved path is always against the resolved target,
@@ -78,9 +96,8 @@ def validate_file_path(
         raise FileNotFoundError(f"Path does not exist: {path_obj}")
 
     # Ensure path is not in sensitive system directories
-    sensitive_dirs = ["/etc", "/boot", "/sys", "/proc", "/dev", "/root"]
     path_parts = path_obj.parts
-    if len(path_parts) > 1 and path_parts[1] in [d.strip("/") for d in sensitive_dirs]:
+    if len(path_parts) > 1 and path_parts[1] in _SENSITIVE_TOPLEVEL_DIRS:
         logger.warning(f"Attempting to access sensitive directory: {path_obj}")
 
     return path_obj
@@ -99,8 +116,11 @@ def validate_model_name(model_name: str) -> str:
     Raises:
         ValueError: If model name is invalid
     """
+    if not isinstance(model_name, str):
+        raise ValueError(f"model_name must be a string, got {type(model_name).__name__}")
+
     # Allow alphanumeric, dots, dashes, underscores, and forward slashes
-    if not re.match(r"^[a-zA-Z0-9._/-]+$", model_name):
+    if not model_name or model_name.translate(_MODEL_NAME_CHARS):
         raise ValueError(f"Invalid model name: {model_name}")
 
     # Prevent path traversal in model names
@@ -129,7 +149,7 @@ def validate_language(language: str) -> str:
         raise ValueError(f"language must be a string, got {type(language).__name__}")
     if language == "auto":
         return language
-    if not re.match(r"^[a-z]{2,3}$", language):
+    if not _LANGUAGE_RE.match(language):
         raise ValueError(
             f"Invalid language code: {language!r}. "
             "Expected a 2- or 3-letter ISO-639 code (e.g. 'en', 'es', 'yue') or 'auto'."
@@ -195,7 +215,7 @@ def validate_postprocess_profile(name: str, profile: object) -> dict[str, Any]:
                 f"postprocess profile {name!r} api_key_env must be a string, "
                 f"got {type(env_name).__name__}"
             )
-        if not re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", env_name):
+        if not _ENV_VAR_RE.match(env_name):
             raise ValueError(
                 f"postprocess profile {name!r} api_key_env {env_name!r} is not a valid "
                 "environment variable name"
@@ -213,6 +233,29 @@ def validate_postprocess_profile(name: str, profile: object) -> dict[str, Any]:
     return profile
 
 
+# Shell metacharacters that must never appear in an executable name, as a
+# str.translate deletion table: one pass detects any of them.
+_DANGEROUS_CHAR_TABLE = dict.fromkeys(map(ord, ";&|`$(){}<>\n\r"))
+
+# Whitelist known safe commands
+_SAFE_COMMANDS = frozenset(
+    {
+        "ydotool",
+        "wl-copy",
+        "xclip",
+        "notify-send",
+        "pactl",
+        "aplay",
+        "ffmpeg",
+        "sox",
+        # Compositor IPC clients used by the focus guard (read-only queries).
+        "niri",
+        "swaymsg",
+        "hyprctl",
+    }
+)
+
+
 def validate_command(command: list[str]) -> list[str]:
     """
     Validate a command for subprocess execution.
@@ -234,37 +277,25 @@ def validate_command(command: list[str]) -> list[str]:
     # notifiable verbatim. Only the executable name itself is checked: a
     # metacharacter there means something tainted was spliced into the
     # command, not legitimate data.
-    dangerous_chars = [";", "&", "|", "`", "$", "(", ")", "{", "}", "<", ">", "\n", "\r"]
     executable = str(command[0])
-    for char in dangerous_chars:
-        if char in executable:
-            raise SecurityError(
-                f"Potentially dangerous character {char!r} in command name: {executable}"
-            )
-
-    # Whitelist known safe commands
-    safe_commands = [
-        "ydotool",
-        "wl-copy",
-        "xclip",
-        "notify-send",
-        "pactl",
-        "aplay",
-        "ffmpeg",
-        "sox",
-        # Compositor IPC clients used by the focus guard (read-only queries).
-        "niri",
-        "swaymsg",
-        "hyprctl",
-    ]
+    if len(executable.translate(_DANGEROUS_CHAR_TABLE)) != len(executable):
+        char = next(c for c in executable if ord(c) in _DANGEROUS_CHAR_TABLE)
+        raise SecurityError(
+            f"Potentially dangerous character {char!r} in command name: {executable}"
+        )
 
-    cmd_name = os.path.basename(command[0])
-    if cmd_name not in safe_commands:
+    cmd_name = executable.rpartition("/")[2]  # POSIX basename
+    if cmd_name not in _SAFE_COMMANDS:
         logger.warning(f"Executing non-whitelisted command: {cmd_name}")
 
     return command
 
 
+# Anything sanitize_text_for_clipboard would rewrite: null bytes, carriage
+# returns, tabs, and runs of spaces or newlines.
+_CLIPBOARD_NORMALIZED_SEQS = ("\x00", "\r", "\t", "  ", "\n\n")
+
+
 def sanitize_text_for_clipboard(text: str, max_length: int = 100000) -> str:
     """
     Sanitize text before copying to clipboard.
@@ -287,12 +318,17 @@ def sanitize_text_for_clipboard(text: str, max_length: int = 100000) -> str:
         logger.warning(f"Text truncated from {len(text)} to {max_length} characters")
         text = text[:max_length]
 
+    # Fast path: typical transcripts have nothing to normalize, and these
+    # substring scans are far cheaper than the two regex passes below.
+    if not any(seq in text for seq in _CLIPBOARD_NORMALIZED_SEQS):
+        return text.strip()
+
     # Remove null bytes which can cause issues
     text = text.replace("\x00", "")
 
     # Normalize whitespace
-    text = re.sub(r"[\r\n]+", "\n", text)
-    text = re.sub(r"[ \t]+", " ", text)
+    text = _NEWLINE_RUN_RE.sub("\n", text)
+    text = _BLANK_RUN_RE.sub(" ", text)
 
     return text.strip()
 
@@ -320,11 +356,15 @@ def sanitize_text_for_typing(text: str, max_length: int = 10000) -> str:
         text = text[:max_length]
 
     # Remove control characters except newline and tab
-    text = re.sub(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]", "", text)
+    text = text.translate(_CONTROL_CHAR_TABLE)
 
     return text
 
 
+_VALID_SAMPLE_RATES = frozenset({8000, 16000, 22050, 44100, 48000})
+_VALID_CHANNELS = frozenset({1, 2})
+
+
 def validate_audio_params(
     sample_rate: int, channels: int = 1, chunk_size: int = 1024
 ) -> tuple[int, int, int]:
@@ -342,13 +382,12 @@ def validate_audio_params(
     Raises:
         ValueError: If parameters are invalid
     """
-    # Valid sample rates
-    valid_sample_rates = [8000, 16000, 22050, 44100, 48000]
-    if sample_rate not in valid_sample_rates:
-        raise ValueError(f"Invalid sample rate: {sample_rate}. Must be one of {valid_sample_rates}")
+    if sample_rate not in _VALID_SAMPLE_RATES:
+        raise ValueError(
+            f"Invalid sample rate: {sample_rate}. Must be one of {sorted(_VALID_SAMPLE_RATES)}"
+        )
 
-    # Valid channel counts
-    if channels not in [1, 2]:
+    if channels not in _VALID_CHANNELS:
         raise ValueError(f"Invalid channel count: {channels}. Must be 1 or 2")
 
     # Valid chunk sizes (powers of 2 between 256 and 8192)
@@ -394,8 +433,8 @@ def validate_json_config(config: dict[str, Any]) -> dict[str, Any]:
         "silence_threshold_fallback": (0, 10000),
         "silence_threshold_min": (0, 10000),
         "silence_threshold_max": (0, 10000),
+        "vad_aggressiveness": (0, 3),
         "silence_duration": (0, 60),
-        "pre_speech_padding": (0, 10),
         "max_recording_duration": (0, 3600),
         "long_mode_silence_timeout": (5, 3600),
         "long_mode_max_session_duration": (60, 86400),
@@ -432,6 +471,7 @@ def validate_json_config(config: dict[str, Any]) -> dict[str, Any]:
         "fw_compute_type": ["int8", "float16", "float32"],
         "device": ["cpu", "cuda", "auto"],
         "output_mode": ["type", "clipboard"],
+        "vad_backend": ["rms", "webrtc"],
     }
     for param, choices in choice_params.items():
         if param in config and config[param] not in choices:
@@ -468,7 +508,28 @@ def validate_json_config(config: dict[str, Any]) -> dict[str, Any]:
     return config
 
 
-_UNSET = object()
+# subprocess.run kwargs callers may pass through; anything else (env, cwd,
+# shell, ...) is dropped.
+_ALLOWED_SUBPROCESS_KWARGS = frozenset(
+    {"input", "capture_output", "text", "encoding", "stdout", "stderr", "check", "timeout"}
+)
+
+
+@functools.cache
+def command_available(name: str) -> bool:
+    """
+    Check once per process whether an optional helper binary is on PATH.
+
+    Lets callers skip best-effort commands (notifications) outright instead
+    of paying a fork/exec just to catch FileNotFoundError every time.
+
+    Args:
+        name: Executable name to look up
+
+    Returns:
+        True if the executable was found on PATH
+    """
+    return shutil.which(name) is not None
 
 
 def safe_subprocess_run(command: list[str], **kwargs: Any) -> Any:
@@ -493,29 +554,11 @@ def safe_subprocess_run(command: list[str], **kwargs: Any) -> Any:
 
     command = validate_command(command)
 
-    timeout = kwargs.get("timeout", _UNSET)
-    if timeout is _UNSET:
-        timeout = 30
-
-    safe_kwargs: dict[str, Any] = {
-        "shell": False,  # Never use shell=True
-        "timeout": timeout,
-        "check": kwargs.get("check", False),
-    }
-
-    allowed_kwargs = [
-        "input",
-        "capture_output",
-        "text",
-        "encoding",
-        "stdout",
-        "stderr",
-        "check",
-        "timeout",
-    ]
-    for k, v in kwargs.items():
-        if k in allowed_kwargs:
-            safe_kwargs[k] = v
+    # Defaults first, then the caller's allowed kwargs on top — an explicit
+    # timeout=None therefore still disables the timeout.
+    safe_kwargs: dict[str, Any] = {"timeout": 30, "check": False}
+    safe_kwargs.update({k: v for k, v in kwargs.items() if k in _ALLOWED_SUBPROCESS_KWARGS})
+    safe_kwargs["shell"] = False  # Never use shell=True
 
     try:
         return subprocess.run(command, **safe_kwargs)
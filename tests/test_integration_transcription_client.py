@@ -21,7 +21,7 @@ from __future__ import annotations
 
 import threading
 import time
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
 import numpy as np
@@ -46,16 +46,30 @@ def _loud_chunk() -> bytes:
 
 
 class _FakeStream:
-    def __init__(self, chunks: list[bytes]) -> None:
-        self.queue = list(chunks)
+    """Callback-mode stream: a thread feeds the queued chunks, then paced silence."""
 
-    def read(self, n_samples: int, exception_on_overflow: bool = False) -> bytes:
-        if self.queue:
-            return self.queue.pop(0)
-        return _silent_chunk()
+    def __init__(self, chunks: list[bytes], callback: Callable[..., object]) -> None:
+        self.queue = list(chunks)
+        self.callback = callback
+        self.stopped = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self.stopped:
+            if self.queue:
+                chunk = self.queue.pop(0)
+            else:
+                time.sleep(0.001)
+                chunk = _silent_chunk()
+            self.callback(chunk, SAMPLES_PER_CHUNK, {}, 0)
+
+    def is_active(self) -> bool:
+        return not self.stopped
 
     def stop_stream(self) -> None:
-        pass
+        self.stopped = True
+        self._thread.join(timeout=1)
 
     def close(self) -> None:
         pass
@@ -65,9 +79,9 @@ class _FakePyAudio:
     def __init__(self) -> None:
         pass
 
-    def open(self, **_kwargs: object) -> _FakeStream:
+    def open(self, **kwargs: object) -> _FakeStream:
         chunks: list[bytes] = getattr(type(self), "_next_chunks", [])
-        return _FakeStream(chunks)
+        return _FakeStream(chunks, kwargs["stream_callback"])  # type: ignore[arg-type]
 
     def terminate(self) -> None:
         pass
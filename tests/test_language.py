@@ -17,7 +17,7 @@ import json
 import sys
 import threading
 import time
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
 import numpy as np
@@ -298,16 +298,30 @@ def _loud_chunk() -> bytes:
 
 
 class _FakeStream:
-    def __init__(self, chunks: list[bytes]) -> None:
-        self.queue = list(chunks)
+    """Callback-mode stream: a thread feeds the queued chunks, then paced silence."""
 
-    def read(self, n_samples: int, exception_on_overflow: bool = False) -> bytes:
-        if self.queue:
-            return self.queue.pop(0)
-        return _silent_chunk()
+    def __init__(self, chunks: list[bytes], callback: Callable[..., object]) -> None:
+        self.queue = list(chunks)
+        self.callback = callback
+        self.stopped = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self.stopped:
+            if self.queue:
+                chunk = self.queue.pop(0)
+            else:
+                time.sleep(0.001)
+                chunk = _silent_chunk()
+            self.callback(chunk, SAMPLES_PER_CHUNK, {}, 0)
+
+    def is_active(self) -> bool:
+        return not self.stopped
 
     def stop_stream(self) -> None:
-        pass
+        self.stopped = True
+        self._thread.join(timeout=1)
 
     def close(self) -> None:
         pass
@@ -316,8 +330,8 @@ class _FakeStream:
 class _FakePyAudio:
     _next_chunks: list[bytes] = []
 
-    def open(self, **_kwargs: object) -> _FakeStream:
-        return _FakeStream(type(self)._next_chunks)
+    def open(self, **kwargs: object) -> _FakeStream:
+        return _FakeStream(type(self)._next_chunks, kwargs["stream_callback"])  # type: ignore[arg-type]
 
     def terminate(self) -> None:
         pass
@@ -6,6 +6,8 @@ extracted into its own module.
 
 from __future__ import annotations
 
+import threading
+
 import pytest
 
 
@@ -28,6 +30,7 @@ def test_notify_suppresses_missing_notify_send(monkeypatch: pytest.MonkeyPatch):
     def fake_run(cmd: list[str], **kwargs: object) -> _Completed:
         raise FileNotFoundError("notify-send not installed")
 
+    monkeypatch.setattr(main_mod, "command_available", lambda _name: True)
     monkeypatch.setattr(main_mod, "safe_subprocess_run", fake_run)
 
     # Must not raise.
@@ -43,6 +46,7 @@ def test_notify_dispatches_to_notify_send(monkeypatch: pytest.MonkeyPatch):
         calls.append(list(cmd))
         return _Completed()
 
+    monkeypatch.setattr(main_mod, "command_available", lambda _name: True)
     monkeypatch.setattr(main_mod, "safe_subprocess_run", fake_run)
 
     main_mod._notify("hello there")
@@ -52,6 +56,30 @@ def test_notify_dispatches_to_notify_send(monkeypatch: pytest.MonkeyPatch):
     assert calls[0][2] == "hello there"
 
 
+def test_notify_skips_subprocess_when_notify_send_missing(monkeypatch: pytest.MonkeyPatch):
+    from talkat import main as main_mod
+
+    def fake_run(cmd: list[str], **kwargs: object) -> _Completed:
+        raise AssertionError("notify-send should not be spawned")
+
+    monkeypatch.setattr(main_mod, "command_available", lambda _name: False)
+    monkeypatch.setattr(main_mod, "safe_subprocess_run", fake_run)
+
+    main_mod._notify("hello")
+
+
+def test_notify_in_background_sends_off_the_calling_thread(monkeypatch: pytest.MonkeyPatch):
+    from talkat import main as main_mod
+
+    senders: list[str] = []
+    monkeypatch.setattr(
+        main_mod, "_notify", lambda _msg: senders.append(threading.current_thread().name)
+    )
+
+    main_mod._notify_in_background("Recording...").join(timeout=2)
+    assert senders == ["talkat-notify"]
+
+
 # ---------------------------------------------------------------------------
 # save_transcript — appends to a timestamped file under the transcript dir
 # ---------------------------------------------------------------------------
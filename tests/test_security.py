@@ -7,6 +7,7 @@ import pytest
 
 from talkat.security import (
     SecurityError,
+    command_available,
     safe_subprocess_run,
     sanitize_text_for_clipboard,
     sanitize_text_for_typing,
@@ -47,6 +48,12 @@ def test_sanitize_typing_keeps_newline_and_tab():
     assert sanitize_text_for_typing("a\nb\tc") == "a\nb\tc"
 
 
+def test_sanitize_typing_strips_every_other_control_char():
+    """The whole C0 range and DEL go, except tab/newline/carriage return."""
+    controls = "".join(chr(c) for c in [*range(0x20), 0x7F])
+    assert sanitize_text_for_typing(f"a{controls}b") == "a\t\n\rb"
+
+
 # ---------------------------------------------------------------------------
 # validate_json_config
 # ---------------------------------------------------------------------------
@@ -144,6 +151,19 @@ def test_validate_file_path_blocks_path_traversal():
         validate_file_path("../etc/passwd")
 
 
+@pytest.mark.parametrize("path", ["..\\etc\\passwd", "logs\\../secret"])
+def test_validate_file_path_blocks_backslash_traversal(path: str):
+    """Regression coverage: backslash traversal was already rejected before the
+    separators were folded into one scan, and must stay rejected."""
+    with pytest.raises(SecurityError):
+        validate_file_path(path)
+
+
+def test_validate_file_path_blocks_bare_parent_dir():
+    with pytest.raises(SecurityError):
+        validate_file_path("..")
+
+
 def test_validate_file_path_blocks_symlinks_by_default(tmp_path):
     """Symlinks must be rejected by default.
 
@@ -190,6 +210,14 @@ def test_validate_model_name_rejects_metacharacters():
         validate_model_name("base$(curl evil)")
 
 
+def test_validate_model_name_rejects_empty_trailing_newline_and_non_string():
+    for bad in ("", "base.en\n"):
+        with pytest.raises(ValueError):
+            validate_model_name(bad)
+    with pytest.raises(ValueError):
+        validate_model_name(5)  # type: ignore[arg-type]
+
+
 def test_validate_model_name_blocks_path_traversal():
     with pytest.raises(ValueError):
         validate_model_name("../../etc/passwd")
@@ -267,6 +295,13 @@ def test_sanitize_clipboard_normalizes_newlines():
     assert result == "line1\nline2"
 
 
+def test_sanitize_clipboard_clean_text_only_stripped():
+    """Already-normalized text (the fast path) still gets its ends stripped,
+    and a lone newline pair is collapsed like before."""
+    assert sanitize_text_for_clipboard("  one line\ntwo lines \n") == "one line\ntwo lines"
+    assert sanitize_text_for_clipboard("a\n\nb") == "a\nb"
+
+
 def test_sanitize_clipboard_truncates_to_max_length():
     overlong = "a" * 200
     result = sanitize_text_for_clipboard(overlong, max_length=50)
@@ -469,6 +504,26 @@ def test_safe_subprocess_run_returns_completed_process_verbatim(
     assert result is expected
 
 
+def test_command_available_probes_path_once(monkeypatch: pytest.MonkeyPatch):
+    """The PATH lookup is cached: repeated notifications don't re-probe."""
+    from talkat import security as security_mod
+
+    lookups: list[str] = []
+
+    def fake_which(name: str) -> str | None:
+        lookups.append(name)
+        return None
+
+    monkeypatch.setattr(security_mod.shutil, "which", fake_which)
+    security_mod.command_available.cache_clear()
+    try:
+        assert not command_available("talkat-test-missing")
+        assert not command_available("talkat-test-missing")
+    finally:
+        security_mod.command_available.cache_clear()
+    assert lookups == ["talkat-test-missing"]
+
+
 # ---------------------------------------------------------------------------
 # validate_postprocess_profile (§5a)
 # ---------------------------------------------------------------------------
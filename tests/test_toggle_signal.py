@@ -92,24 +92,36 @@ SAMPLES_PER_READ = 480
 
 
 class _PacedSilentStream:
-    """Endless silence, ~3 ms per read: keeps capture running until a signal
-    stops it, and gives the interpreter constant bytecode boundaries so a
-    pending signal handler runs promptly."""
+    """Endless silence delivered to the stream callback every ~3 ms: keeps
+    capture running until a signal stops it, and wakes the consumer's queue
+    wait often so a pending signal handler runs promptly."""
 
-    def read(self, n_samples: int, exception_on_overflow: bool = False) -> bytes:
-        time.sleep(0.003)
-        return np.zeros(n_samples, dtype=np.int16).tobytes()
+    def __init__(self, callback: Callable[..., object]) -> None:
+        self.callback = callback
+        self.stopped = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self.stopped:
+            time.sleep(0.003)
+            silence = np.zeros(SAMPLES_PER_READ, dtype=np.int16).tobytes()
+            self.callback(silence, SAMPLES_PER_READ, {}, 0)
+
+    def is_active(self) -> bool:
+        return not self.stopped
 
     def stop_stream(self) -> None:
-        pass
+        self.stopped = True
+        self._thread.join(timeout=1)
 
     def close(self) -> None:
         pass
 
 
 class _FakePyAudio:
-    def open(self, **_kwargs: object) -> _PacedSilentStream:
-        return _PacedSilentStream()
+    def open(self, **kwargs: object) -> _PacedSilentStream:
+        return _PacedSilentStream(kwargs["stream_callback"])  # type: ignore[arg-type]
 
     def terminate(self) -> None:
         pass
@@ -16,8 +16,10 @@ above the threshold). What we assert:
 
 from __future__ import annotations
 
+import sys
 import threading
-from collections.abc import Iterator
+import time
+from collections.abc import Callable, Iterator
 
 import numpy as np
 import pytest
@@ -40,24 +42,40 @@ def _silent_chunk() -> bytes:
 
 
 class FakeStream:
-    """Stand-in for pyaudio.Stream that returns queued bytes, then silence forever."""
+    """Stand-in for a callback-mode pyaudio.Stream.
 
-    def __init__(self, chunks: list[bytes]) -> None:
+    A daemon thread plays PortAudio's part: it feeds the queued chunks to the
+    stream callback, then silence forever until the stream is stopped. The
+    silence is paced so an un-terminated session can't flood the queue.
+    """
+
+    def __init__(self, chunks: list[bytes], callback: Callable[..., object]) -> None:
         self.queue: list[bytes] = list(chunks)
-        self.reads = 0
+        self.callback = callback
+        self.delivered = 0
         self.closed = False
         self.stopped = False
-
-    def read(self, n_samples: int, exception_on_overflow: bool = False) -> bytes:
-        self.reads += 1
-        if self.queue:
-            return self.queue.pop(0)
-        # Endless silence — the iterator should terminate via VAD / max_duration
-        # / stop_event before this becomes load-bearing.
-        return _silent_chunk()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self.stopped:
+            if self.queue:
+                chunk = self.queue.pop(0)
+            else:
+                # Endless silence — the iterator should terminate via VAD /
+                # max_duration / stop_event before this becomes load-bearing.
+                time.sleep(0.001)
+                chunk = _silent_chunk()
+            self.callback(chunk, len(chunk) // 2, {}, 0)
+            self.delivered += 1
+
+    def is_active(self) -> bool:
+        return not self.stopped
 
     def stop_stream(self) -> None:
         self.stopped = True
+        self._thread.join(timeout=1)
 
     def close(self) -> None:
         self.closed = True
@@ -73,7 +91,7 @@ class FakePyAudio:
     def open(self, **kwargs: object) -> FakeStream:
         # Tests inject the chunks via a sentinel set on the class beforehand.
         chunks: list[bytes] = getattr(type(self), "_next_chunks", [])
-        self._stream = FakeStream(chunks)
+        self._stream = FakeStream(chunks, kwargs["stream_callback"])  # type: ignore[arg-type]
         return self._stream
 
     def terminate(self) -> None:
@@ -195,6 +213,34 @@ def test_silence_duration_ends_iteration_after_speech(patched_pyaudio):
     assert _loud_chunk() in yielded
 
 
+def test_full_scale_speech_energy_does_not_overflow(patched_pyaudio):
+    """A clipped, full-scale chunk sums to ~5e11 — far past int32. The energy
+    must accumulate in int64, or it wraps and loud speech reads as silence."""
+    full_scale = np.tile(np.array([32767, -32768], dtype=np.int16), SAMPLES_PER_CHUNK // 2)
+    chunks = [full_scale.tobytes()] * 3 + [_silent_chunk()] * 100
+
+    yielded = _drive_session(
+        patched_pyaudio,
+        chunks,
+        threshold=30000,
+        silence_duration=0.2,
+        max_duration=5.0,
+    )
+
+    assert len(yielded) < 30, f"full-scale speech went undetected — yielded {len(yielded)}"
+
+
+def test_smoothing_averages_amplitude_not_energy(patched_pyaudio):
+    """A click between quiet chunks must not read as speech onset: the window
+    averages RMS amplitude (mean 183 < 200), not energy (RMS of the mean square
+    ~221 > 200), which would start the silence timer before anyone speaks."""
+    from talkat.record import RMSSpeechDetector
+
+    detector = RMSSpeechDetector(200, SAMPLES_PER_CHUNK)
+
+    assert [detector.is_speech(_loud_chunk(a)) for a in (100, 100, 350)] == [False] * 3
+
+
 def test_max_duration_caps_iteration(patched_pyaudio):
     """max_duration must bound the total chunks read regardless of VAD state."""
     # 100 chunks fed; threshold=0 so every read attempts to yield.
@@ -208,6 +254,22 @@ def test_max_duration_caps_iteration(patched_pyaudio):
     assert len(yielded) == 3
 
 
+def test_passed_config_is_used_instead_of_reloading(patched_pyaudio, monkeypatch):
+    """A caller's config (with CLI overrides merged) wins over the file on disk."""
+    from talkat import record as record_mod
+    from talkat.config import CODE_DEFAULTS
+    from talkat.record import AudioSession
+
+    def _no_reload() -> dict[str, object]:
+        raise AssertionError("config was reloaded")
+
+    monkeypatch.setattr(record_mod, "load_app_config", _no_reload)
+    patched_pyaudio._next_chunks = []  # type: ignore[attr-defined]
+    cfg = {**CODE_DEFAULTS, "max_recording_duration": 0.15}  # 5 chunks
+    with AudioSession(threshold=0, chunk_size_ms=30, config=cfg) as session:
+        assert len(list(session)) == 5
+
+
 def test_stop_event_short_circuits_iteration(patched_pyaudio):
     """A pre-set stop_event must make iteration return before reading anything."""
     stop_event = threading.Event()
@@ -248,6 +310,36 @@ def test_audiosession_closes_resources_on_exit(patched_pyaudio):
     assert session._p is None
 
 
+def test_chunks_captured_while_consumer_is_blocked_are_kept(patched_pyaudio):
+    """Capture runs on the callback thread, so a stalled consumer loses nothing."""
+    from talkat.record import AudioSession
+
+    patched_pyaudio._next_chunks = [_loud_chunk()] * 10  # type: ignore[attr-defined]
+    with AudioSession(threshold=0, max_duration=0.3, chunk_size_ms=30) as session:
+        stream = session._stream
+        assert stream is not None
+        while stream.delivered < 10:
+            time.sleep(0.001)
+        chunks = list(session)
+    assert chunks[:10] == [_loud_chunk()] * 10
+
+
+def test_iteration_ends_when_stream_stops_delivering(patched_pyaudio, monkeypatch):
+    """A dead stream (device unplugged) ends iteration instead of hanging."""
+    from talkat import record as record_mod
+    from talkat.record import AudioSession
+
+    monkeypatch.setattr(record_mod.AudioSession, "READ_TIMEOUT_S", 0.01)
+    patched_pyaudio._next_chunks = []  # type: ignore[attr-defined]
+    with AudioSession(threshold=0, silence_duration=0.5, max_duration=5) as session:
+        stream = session._stream
+        assert stream is not None
+        stream.stop_stream()
+        while not session._chunks.empty():
+            session._chunks.get_nowait()
+        assert list(session) == []
+
+
 def test_audiosession_raises_when_no_microphone(patched_pyaudio, monkeypatch):
     """If find_microphone returns None, __enter__ raises AudioSessionError."""
     from talkat import record as record_mod
@@ -319,6 +411,120 @@ def test_audiosession_raises_after_all_open_attempts_fail(patched_pyaudio, monke
             pass
 
 
+# ---------------------------------------------------------------------------
+# vad_backend = "webrtc" — a fake webrtcvad module stands in for the C
+# extension; it calls any non-zero frame speech.
+# ---------------------------------------------------------------------------
+
+
+class FakeWebRTCVad:
+    def __init__(self, mode: int) -> None:
+        self.mode = mode
+        self.frames: list[int] = []
+
+    def is_speech(self, frame: bytes, sample_rate: int) -> bool:
+        self.frames.append(len(frame))
+        return any(frame)
+
+
+@pytest.fixture
+def webrtc_config(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[FakeWebRTCVad]]:
+    """Select vad_backend=webrtc and install a fake webrtcvad; yields created Vads."""
+    import types
+
+    from talkat import record as record_mod
+    from talkat.config import CODE_DEFAULTS
+
+    created: list[FakeWebRTCVad] = []
+
+    def _vad(mode: int) -> FakeWebRTCVad:
+        created.append(FakeWebRTCVad(mode))
+        return created[-1]
+
+    fake_module = types.ModuleType("webrtcvad")
+    fake_module.Vad = _vad  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "webrtcvad", fake_module)
+    cfg = {**CODE_DEFAULTS, "vad_backend": "webrtc", "vad_aggressiveness": 3}
+    monkeypatch.setattr(record_mod, "load_app_config", lambda: cfg)
+    yield created
+
+
+def test_webrtc_vad_decides_when_to_stop(patched_pyaudio, webrtc_config):
+    """With the WebRTC backend, its speech call — not the RMS threshold — ends
+    the utterance. A quiet-but-nonzero chunk (RMS 10, far below threshold 200)
+    still counts as speech here."""
+    quiet_speech = _loud_chunk(amplitude=10)
+    chunks = [quiet_speech] * 3 + [_silent_chunk()] * 100
+
+    yielded = _drive_session(
+        patched_pyaudio,
+        chunks,
+        threshold=200,
+        silence_duration=0.2,
+        max_duration=5.0,
+    )
+
+    assert len(yielded) < 30
+    assert yielded[:3] == [quiet_speech] * 3
+    (vad,) = webrtc_config
+    assert vad.mode == 3
+    assert set(vad.frames) == {SAMPLES_PER_CHUNK * 2}
+
+
+def test_webrtc_vad_short_frame_is_not_silence(patched_pyaudio, webrtc_config):
+    """A partial read never reaches webrtcvad (which rejects odd frame sizes)
+    and counts as speech, so it can't run down the silence timer."""
+    short = _silent_chunk()[:-2]
+    chunks = [_loud_chunk()] + [short] * 20
+
+    yielded = _drive_session(
+        patched_pyaudio,
+        chunks,
+        threshold=200,
+        silence_duration=0.2,
+        max_duration=0.63,
+    )
+
+    assert len(yielded) == 21
+    (vad,) = webrtc_config
+    assert vad.frames == [SAMPLES_PER_CHUNK * 2]
+
+
+def test_webrtc_vad_skipped_in_no_vad_mode(patched_pyaudio, webrtc_config):
+    """threshold=0 still means 'never auto-stop' — no Vad is even created."""
+    yielded = _drive_session(patched_pyaudio, [], threshold=0, max_duration=0.15)
+    assert len(yielded) == 5
+    assert webrtc_config == []
+
+
+def test_webrtc_vad_missing_package_falls_back_to_rms(patched_pyaudio, webrtc_config, monkeypatch):
+    """Without the webrtcvad package the RMS threshold takes over."""
+    monkeypatch.setitem(sys.modules, "webrtcvad", None)  # import raises ImportError
+    quiet = _loud_chunk(amplitude=10)  # below threshold: RMS never sees speech
+    yielded = _drive_session(
+        patched_pyaudio,
+        [quiet] * 20,
+        threshold=200,
+        silence_duration=0.2,
+        max_duration=0.48,
+    )
+    assert len(yielded) == 16
+
+
+def test_webrtc_vad_unsupported_chunk_size_falls_back_to_rms(patched_pyaudio, webrtc_config):
+    """webrtcvad only takes 10/20/30 ms frames; other chunk sizes use RMS."""
+    from talkat.record import AudioSession
+
+    chunk = np.full(1024, 10, dtype=np.int16).tobytes()  # 64 ms, below threshold
+    patched_pyaudio._next_chunks = [chunk] * 20  # type: ignore[attr-defined]
+    with AudioSession(
+        threshold=200, silence_duration=0.2, max_duration=0.64, chunk_size_ms=64
+    ) as session:
+        yielded = list(session)
+    assert yielded == [chunk] * 10
+    assert webrtc_config == []
+
+
 # ---------------------------------------------------------------------------
 # calibrate_microphone — same PyAudio stub pattern as AudioSession but
 # different chunk size (default 1024) and no VAD.
@@ -418,6 +624,31 @@ def test_calibrate_falls_back_when_stream_open_fails(monkeypatch: pytest.MonkeyP
     assert threshold == CODE_DEFAULTS["silence_threshold_fallback"]
 
 
+def test_calibrate_retries_transient_open_failure(
+    patched_pyaudio_for_calibrate, monkeypatch: pytest.MonkeyPatch
+):
+    """Calibration opens through AudioSession, so it gets the same
+    fresh-instance retry instead of falling straight back to the default."""
+    from talkat import record as record_mod
+    from talkat.record import calibrate_microphone
+
+    opens: list[object] = []
+
+    class FlakyPyAudio(FakePyAudio):
+        def open(self, **kwargs: object) -> FakeStream:
+            opens.append(self)
+            if len(opens) == 1:
+                raise OSError(-9998, "Invalid number of channels")
+            return super().open(**kwargs)
+
+    monkeypatch.setattr(record_mod.pyaudio, "PyAudio", FlakyPyAudio)
+    monkeypatch.setattr(record_mod.AudioSession, "OPEN_RETRY_DELAY_S", 0.0)
+    FlakyPyAudio._next_chunks = [_calibrate_chunk(400) for _ in range(16)]  # type: ignore[attr-defined]
+
+    assert calibrate_microphone(duration=1) == pytest.approx(400.0, abs=1.0)
+    assert len(opens) == 2
+
+
 def test_calibrate_respects_custom_min_max_from_config(
     patched_pyaudio_for_calibrate, monkeypatch: pytest.MonkeyPatch
 ):
@@ -439,3 +670,15 @@ def test_calibrate_respects_custom_min_max_from_config(
     patched_pyaudio_for_calibrate._next_chunks = [_calibrate_chunk(0) for _ in range(16)]
     threshold = calibrate_microphone(duration=1)
     assert threshold == 100.0
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 156])
+def test_sorted_percentiles_match_numpy(size: int):
+    """The sorted-array shortcut must interpolate exactly like np.percentile."""
+    from talkat.record import _sorted_percentiles
+
+    values = np.sort(np.random.default_rng(size).uniform(0, 3000, size))
+    percents = [0, 50, 75, 90, 95, 99, 100]
+    np.testing.assert_allclose(
+        _sorted_percentiles(values, percents), np.percentile(values, percents), rtol=1e-12
+    )